@@ -8,21 +8,44 @@ def error(s):
     print(s, file=stderr); exit(1)
 
 # imports
+from collections import defaultdict, namedtuple
+from concurrent.futures import Future
+from contextlib import contextmanager
+from functools import lru_cache
+from operator import itemgetter
+from os import environ, makedirs, path, replace
+from pickle import dump, load
 from sys import stderr
+from textwrap import wrap
+from threading import Thread
+from time import time
 try:
-    from prompt_toolkit.formatted_text import HTML
+    from prompt_toolkit.application import Application, get_app
+    from prompt_toolkit.formatted_text import HTML, fragment_list_to_text, to_formatted_text
+    from prompt_toolkit.key_binding import KeyBindings, merge_key_bindings
+    from prompt_toolkit.key_binding.bindings.focus import focus_next, focus_previous
+    from prompt_toolkit.key_binding.defaults import load_key_bindings
+    from prompt_toolkit.keys import Keys
+    from prompt_toolkit.layout import Dimension, FormattedTextControl, HSplit, Layout, Window
+    from prompt_toolkit.layout.margins import Margin
+    from prompt_toolkit.mouse_events import MouseEventType
     from prompt_toolkit.shortcuts import input_dialog, message_dialog, radiolist_dialog
+    from prompt_toolkit.widgets import Button, Dialog, Label
 except:
     error("Unable to import 'prompt_toolkit'. Install via: 'pip install prompt_toolkit'")
-try:
-    from plexapi.myplex import MyPlexAccount
-except:
-    error("Unable to import 'plexapi'. Install via: 'pip install plexapi'")
 
 # useful constants
 VERSION = '0.0.1'
 TOOL_NAME = 'Plex Library Viewer'
 LINE_WIDTH = 120
+CACHE_DIR = path.join(environ.get('XDG_CACHE_HOME', path.expanduser('~/.cache')), 'plex-library-viewer')
+CACHE_VERSION = 5 # bump whenever the format of the cached media changes
+HTTP_POOL_SIZE = 16 # max number of kept-alive connections per host
+REDRAW_INTERVAL = 0.05 # seconds over which dialog redraws are coalesced (e.g. while holding an arrow key)
+ERASE_LINE = '\x1b[2K\r' # ANSI: erase the entire current line and return to its start
+
+# connections to servers started by connect_in_background: SERVER_CONNECTIONS[client identifier] = Future of the PlexServer
+SERVER_CONNECTIONS = dict()
 
 # mapping from media types to human-readable text
 MEDIA_TEXT = {
@@ -31,128 +54,411 @@ MEDIA_TEXT = {
     'show': 'TV Show',
 }
 
-# text / messages
-TEXT = {
-    'prompt_password': "Please enter your My Plex password (append your 2FA code at the end if 2FA is enabled):",
-    'prompt_username': "Please enter your My Plex username:",
-    'select_movie': "Please select movie:",
-    'select_server': "Please select Plex Media Server:",
-    'select_server_media_type': "Please select media type:",
-    'select_server_operation': "Please select an operation to perform on this Plex Media Server",
-    'status_loading_all': "Loading all items from server (this might take a while)...",
-    'title_error': HTML("<ansired>ERROR</ansired>"),
-    'title_main': HTML("<ansiblue>%s v%s</ansiblue>" % (TOOL_NAME, VERSION)),
-    'welcome': "Welcome to the %s! This simple tool aims to provide a user-friendly command-line interface for exploring Plex libraries using the Plex API.\n\nMade by Niema Moshiri (niemasd), 2024" % TOOL_NAME,
+# fields kept for each media item (everything show_movie needs, so viewing an item needs no further requests)
+# items are stored as lightweight Media tuples rather than plexapi objects, which are very large in memory
+MEDIA_FIELDS = ('ratingKey', 'type', 'title', 'year', 'duration', 'editionTitle', 'originalTitle', 'originallyAvailableAt', 'contentRating', 'rating')
+Media = namedtuple('Media', MEDIA_FIELDS)
+
+# query parameters for listing a library section (page by page): skip everything we don't display to keep responses small
+# (the section's primary type is added per section, so the listing matches section.all() and section.totalSize)
+LIBRARY_PAGE_SIZE = 500
+LIBRARY_ALL_PARAMS = {
+    'checkFiles': 0,
+    'includeAllConcerts': 0,
+    'includeBandwidths': 0,
+    'includeChapters': 0,
+    'includeChildren': 0,
+    'includeCollections': 0,
+    'includeConcerts': 0,
+    'includeExternalMedia': 0,
+    'includeExtras': 0,
+    'includeFields': 0,
+    'includeGeolocation': 0,
+    'includeGuids': 0,
+    'includeLoudnessRamps': 0,
+    'includeMarkers': 0,
+    'includeOnDeck': 0,
+    'includePopularLeaves': 0,
+    'includePreferences': 0,
+    'includeRelated': 0,
+    'includeRelatedCount': 0,
+    'includeReviews': 0,
+    'includeStations': 0,
 }
 
-# break a long string into multiple lines
+# text / messages
+ERROR_CONNECT = "Unable to connect to Plex Media Server '%s':\n\n%s"
+PROMPT_PASSWORD = "Please enter your My Plex password (append your 2FA code at the end if 2FA is enabled):"
+PROMPT_USERNAME = "Please enter your My Plex username:"
+SELECT_MOVIE = "Please select movie:"
+SELECT_SERVER = "Please select Plex Media Server:"
+SELECT_SERVER_MEDIA_TYPE = "Please select media type:"
+SELECT_SERVER_OPERATION = "Please select an operation to perform on this Plex Media Server"
+STATUS_LOADING_ALL = "Loading all items from server (this might take a while)..."
+STATUS_LOADING_PROGRESS = "Loading all items from server (this might take a while)... %d / %d"
+TITLE_ERROR = HTML("<ansired>ERROR</ansired>")
+TITLE_MAIN = HTML("<ansiblue>%s v%s</ansiblue>" % (TOOL_NAME, VERSION))
+WELCOME = "Welcome to the %s! This simple tool aims to provide a user-friendly command-line interface for exploring Plex libraries using the Plex API.\n\nMade by Niema Moshiri (niemasd), 2024" % TOOL_NAME
+
+# break a long string into multiple lines (existing line breaks are kept)
 def break_string(s, max_width=LINE_WIDTH):
-    col = 0; text = ''
-    for word in s.split(' '):
-        if col + len(word) + 1 >= max_width:
-            text += '\n'; col = 0
-        text += (word + ' '); col += (len(word) + 1)
-    return text
-
-# convert millisecond int to string
+    return '\n'.join('\n'.join(wrap(line, width=max_width, break_long_words=False, break_on_hyphens=False)) for line in s.split('\n'))
+
+# convert millisecond int to string (durations repeat a lot, e.g. episodes of a show, so cache them)
+@lru_cache(maxsize=4096)
 def ms_to_str(d):
     h = d // 3600000; d %= 3600000 # hours
     m = d //   60000; d %=   60000 # minutes
     s = d //    1000; d %=    1000 # seconds
-    return '%s:%s:%s.%s' % (str(h).zfill(2), str(m).zfill(2), str(s).zfill(2), str(d).zfill(3))
+    return f'{h:02d}:{m:02d}:{s:02d}.{d:03d}'
+
+# run a prompt_toolkit dialog, coalescing redraws so fast key repeats don't redraw the whole dialog every time
+def run_dialog(dialog):
+    dialog.min_redraw_interval = REDRAW_INTERVAL
+    dialog.max_render_postpone_time = REDRAW_INTERVAL
+    return dialog.run()
+
+# like radiolist_dialog, but only the rows currently on screen are rendered, so it stays fast for lists of thousands of values
+def list_dialog(title='', text='', values=()):
+    checked = 0 # index of the checked value (returned on Ok)
+    cursor = 0  # index of the value under the cursor
+    top = 0     # index of the first value on screen
+
+    # number of rows that fit in the list (as of the last render)
+    def num_rows():
+        if window.render_info is None:
+            return get_app().output.get_size().rows
+        return window.render_info.window_height
+
+    # move the cursor (and check the clicked value) on mouse click
+    def mouse_handler(mouse_event):
+        nonlocal checked, cursor
+        if mouse_event.event_type == MouseEventType.MOUSE_UP:
+            cursor = checked = min(len(values) - 1, top + mouse_event.position.y)
+
+    # render the visible rows (scrolling just enough to keep the cursor on screen)
+    def get_text():
+        nonlocal top
+        rows = num_rows()
+        top = min(max(top, cursor - rows + 1), cursor)
+        fragments = list()
+        for i in range(top, min(top + rows, len(values))):
+            style = 'class:radio'
+            if i == checked:
+                style += ' class:radio-checked'
+            if i == cursor:
+                style += ' class:radio-selected'
+                fragments.append(('[SetCursorPosition]', ''))
+            fragments.append((style, '(*) ' if i == checked else '( ) ', mouse_handler))
+            fragments.extend((fragment[0], fragment[1], mouse_handler) for fragment in to_formatted_text(values[i][1], style=style))
+            fragments.append(('', '\n'))
+        return fragments[:-1]
+
+    # scrollbar of the whole list (RadioList's ScrollbarMargin would only see the rows on screen)
+    class ListScrollbar(Margin):
+        def get_width(self, get_ui_content):
+            return 1
+        def create_margin(self, window_render_info, width, height):
+            if height <= 2 or len(values) <= height:
+                return list()
+            track = height - 2 # rows between the arrows
+            thumb_size = max(1, track * height // len(values))
+            thumb_top = (track - thumb_size) * top // (len(values) - height)
+            fragments = [('class:scrollbar.arrow', '^'), ('', '\n')]
+            for i in range(track):
+                fragments.append(('class:scrollbar.button' if thumb_top <= i < thumb_top + thumb_size else 'class:scrollbar.background', ' '))
+                fragments.append(('', '\n'))
+            fragments.append(('class:scrollbar.arrow', 'v'))
+            return fragments
+
+    # key bindings of the list (same as RadioList)
+    kb = KeyBindings()
+    @kb.add('up')
+    @kb.add('k')
+    def _up(event):
+        nonlocal cursor
+        cursor = max(0, cursor - 1)
+    @kb.add('down')
+    @kb.add('j')
+    def _down(event):
+        nonlocal cursor
+        cursor = min(len(values) - 1, cursor + 1)
+    @kb.add('pageup')
+    def _pageup(event):
+        nonlocal cursor
+        cursor = max(0, cursor - num_rows())
+    @kb.add('pagedown')
+    def _pagedown(event):
+        nonlocal cursor
+        cursor = min(len(values) - 1, cursor + num_rows())
+    @kb.add('home')
+    def _home(event):
+        nonlocal cursor
+        cursor = 0
+    @kb.add('end')
+    def _end(event):
+        nonlocal cursor
+        cursor = len(values) - 1
+    @kb.add('enter')
+    @kb.add(' ')
+    def _check(event):
+        nonlocal checked
+        checked = cursor
+    @kb.add(Keys.Any)
+    def _find(event):
+        nonlocal cursor
+        for i in list(range(cursor + 1, len(values))) + list(range(cursor + 1)):
+            if fragment_list_to_text(to_formatted_text(values[i][1])).lower().startswith(event.data.lower()):
+                cursor = i; break
+
+    # build dialog (same layout as radiolist_dialog)
+    window = Window(content=FormattedTextControl(get_text, key_bindings=kb, focusable=True), style='class:radio-list', right_margins=[ListScrollbar()], height=Dimension(min=1, preferred=len(values)), dont_extend_height=True, get_vertical_scroll=lambda window: 0)
+    dialog = Dialog(
+        title=title,
+        body=HSplit([Label(text=text, dont_extend_height=True), window], padding=1),
+        buttons=[
+            Button(text='Ok', handler=lambda: get_app().exit(result=values[checked][0])),
+            Button(text='Cancel', handler=lambda: get_app().exit(result=None)),
+        ],
+        with_background=True,
+    )
+    bindings = KeyBindings()
+    bindings.add('tab')(focus_next)
+    bindings.add('s-tab')(focus_previous)
+    return Application(layout=Layout(dialog), key_bindings=merge_key_bindings([load_key_bindings(), bindings]), mouse_support=True, full_screen=True)
 
 # show welcome message
 def show_welcome():
-    message_dialog(title=TEXT['title_main'], text=TEXT['welcome']).run()
+    run_dialog(message_dialog(title=TITLE_MAIN, text=WELCOME))
 
-# sign into My Plex
+# sign into My Plex (plexapi is imported here rather than at the top, so the welcome message shows up faster)
 def authenticate_myplex():
-    username = input_dialog(title=TEXT['title_main'], text=TEXT['prompt_username']).run()
+    try:
+        from plexapi.base import USER_DONT_RELOAD_FOR_KEYS
+        from plexapi.myplex import MyPlexAccount
+        from requests import Session
+        from requests.adapters import HTTPAdapter
+    except:
+        error("Unable to import 'plexapi'. Install via: 'pip install plexapi'")
+
+    # the section listing already has every field we use, so a missing (None) field means it's unset, not unfetched
+    USER_DONT_RELOAD_FOR_KEYS.update(MEDIA_FIELDS)
+
+    username = run_dialog(input_dialog(title=TITLE_MAIN, text=PROMPT_USERNAME))
     if username is None:
         exit(1)
-    password = input_dialog(title=TEXT['title_main'], text=TEXT['prompt_password']).run()
+    password = run_dialog(input_dialog(title=TITLE_MAIN, text=PROMPT_PASSWORD))
     if password is None:
         exit(1)
-    account = MyPlexAccount(username, password)
+
+    # one keep-alive session is shared by My Plex and every server connected to through it (resource.connect() reuses it)
+    session = Session(); adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+    session.mount('http://', adapter); session.mount('https://', adapter)
+    account = MyPlexAccount(username, password, session=session)
     return account
 
+# get the set of roles a MyPlexResource provides (e.g. 'server', 'client', 'player')
+def resource_provides(resource):
+    return frozenset(role.strip() for role in resource.provides.lower().split(','))
+
+# connect to a server in a background daemon thread (so pending connects never delay exiting)
+# successful connections are reused for the rest of the session, and failed ones are retried on the next call
+# returns a Future of the connected PlexServer
+def connect_in_background(resource):
+    future = SERVER_CONNECTIONS.get(resource.clientIdentifier)
+    if future is None or (future.done() and future.exception() is not None):
+        future = Future()
+        def connect():
+            try:
+                future.set_result(resource.connect())
+            except Exception as e:
+                future.set_exception(e)
+        Thread(target=connect, daemon=True).start()
+        SERVER_CONNECTIONS[resource.clientIdentifier] = future
+    return future
+
 # select Plex Media Server
 def select_server(account):
     # iterate over MyPlexResource objects to find servers: https://python-plexapi.readthedocs.io/en/latest/modules/myplex.html#plexapi.myplex.MyPlexResource
-    servers = list()
-    for resource in account.resources():
-        if 'server' in resource.provides.lower():
-            servers.append((resource,resource.name))
-    servers.sort(key=lambda x: x[1])
-    selection = radiolist_dialog(title=TEXT['title_main'], text=TEXT['select_server'], values=servers).run()
-    if selection is None:
-        return None
-    return selection.connect()
+    servers = sorted(((resource,resource.name) for resource in account.resources() if 'server' in resource_provides(resource)), key=itemgetter(1))
+    while True:
+        # connect to all servers in the background while the user is choosing (each connect() already races the server's addresses)
+        connections = {resource: connect_in_background(resource) for resource, _ in servers}
+        selection = run_dialog(radiolist_dialog(title=TITLE_MAIN, text=SELECT_SERVER, values=servers))
+        if selection is None:
+            return None
+        try:
+            return connections[selection].result()
+        except Exception:
+            pass # the background connect may have failed long before the user picked this server, so try again now
+
+        # retry once, and if the server is still unreachable, show the error and re-prompt for server selection
+        try:
+            server = selection.connect()
+        except Exception as e:
+            run_dialog(message_dialog(title=TITLE_ERROR, text=ERROR_CONNECT % (selection.name, e)))
+            continue
+        future = Future(); future.set_result(server)
+        SERVER_CONNECTIONS[selection.clientIdentifier] = future
+        return server
 
 # select what you want to do with a Plex Media Server
 def select_server_operation(server):
     values = [
         ('browse', HTML('<ansired>Browse</ansired> all media from all library sections')),
+        ('refresh', HTML('<ansired>Refresh</ansired> the cached list of media from all library sections')),
     ]
-    values.sort(key=lambda x: x[1])
-    return radiolist_dialog(title=server.friendlyName, text=TEXT['select_server_operation'], values=values).run()
-
-# get all media from a server, and return as media_by_type[media_type] = list of media of that type
-def server_list_all(server, verbose=True):
-    if verbose:
-        print(TEXT['status_loading_all'], end='\r')
-    all_media = server.library.all()
-    media_by_type = dict()
-    for item in all_media:
-        if item.type not in media_by_type:
-            media_by_type[item.type] = list()
-        media_by_type[item.type].append(item)
-    if verbose:
-        print(' '*len(TEXT['status_loading_all']), end='\r')
+    values.sort(key=itemgetter(0)) # labels are HTML (not comparable), so sort by operation
+    return run_dialog(radiolist_dialog(title=server.friendlyName, text=SELECT_SERVER_OPERATION, values=values))
+
+# show a status line on the terminal (erased when done), and yield a function that replaces its text
+@contextmanager
+def loading_status(msg, verbose=True):
+    def update_status(msg):
+        if verbose:
+            print(ERASE_LINE + msg, end='', flush=True)
+    update_status(msg)
+    try:
+        yield update_status
+    finally:
+        if verbose:
+            print(ERASE_LINE, end='', flush=True)
+
+# human-readable label of a media item (shown in menus)
+def media_label(item):
+    if item.year is None:
+        return item.title
+    return '%s (%d)' % (item.title, item.year)
+
+# path of the on-disk cache of a server's media
+def _cache_path(server):
+    return path.join(CACHE_DIR, '%s.pkl' % server.machineIdentifier)
+
+# get the updatedAt of the most recently added/edited item in a library section (or None if there's none)
+def latest_item_update(section):
+    from plexapi.exceptions import BadRequest, NotFound # plexapi is imported lazily (see authenticate_myplex)
+    try:
+        items = section.search(sort='updatedAt:desc', maxresults=1)
+    except (BadRequest, NotFound): # section type can't be sorted by updatedAt
+        return None
+    if len(items) == 0:
+        return None
+    return items[0].updatedAt
+
+# get a stamp that changes whenever the contents of a server's library sections change; the cache depends on these fields of each section:
+# - contentChangedAt: counter the server bumps whenever an item is added, edited, or removed (plexapi doesn't parse it, so read the raw XML)
+# - updatedAt of the most recently updated item: catches additions and edits even if the server doesn't report contentChangedAt
+# - the section's own key and updatedAt: catch added/removed sections and changes to section settings
+def library_stamp(sections):
+    return sorted((section.key, section.updatedAt, section._data.attrib.get('contentChangedAt'), latest_item_update(section)) for section in sections)
+
+# load cached media_by_type of a server (or None if there's no up-to-date cache)
+def load_cache(server, stamp):
+    try:
+        with open(_cache_path(server), 'rb') as f:
+            cache = load(f)
+    except Exception:
+        return None
+    if cache.get('version') != CACHE_VERSION or cache.get('stamp') != stamp:
+        return None
+    return cache['media_by_type']
+
+# save media_by_type of a server to the cache (write to a temporary file and rename, so the cache is never half-written)
+def save_cache(server, stamp, media_by_type):
+    cache = {
+        'version': CACHE_VERSION,
+        'server_version': server.version,
+        'timestamp': time(),
+        'stamp': stamp,
+        'media_by_type': media_by_type,
+    }
+    cache_path = _cache_path(server); tmp_path = '%s.tmp' % cache_path
+    try:
+        makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            dump(cache, f)
+        replace(tmp_path, cache_path)
+    except OSError:
+        pass # caching is best-effort
+
+# get all media from a server, and return as media_by_type[media_type] = list of (media, label) tuples of that type
+# each media item is a Media tuple of MEDIA_FIELDS (None for fields the item doesn't have), and label is its media_label
+# if refresh is True, ignore the on-disk cache (and replace it with freshly-loaded media)
+def server_list_all(server, verbose=True, refresh=False):
+    from plexapi.utils import searchType # plexapi is imported lazily (see authenticate_myplex)
+    sections = server.library.sections()
+    stamp = library_stamp(sections)
+    media_by_type = None if refresh else load_cache(server, stamp)
+    if media_by_type is not None:
+        return media_by_type
+    media_by_type = defaultdict(list); num_loaded = 0
+    with loading_status(STATUS_LOADING_ALL, verbose=verbose) as update_status:
+        if verbose:
+            num_total = sum(section.totalSize for section in sections)
+        for section in sections:
+            # load one page at a time so progress can be shown (only the section's primary type, e.g. no collections)
+            key = '/library/sections/%s/all' % section.key; start = 0
+            params = dict(LIBRARY_ALL_PARAMS, type=searchType(section.TYPE))
+            while True:
+                page = server.fetchItems(key, container_start=start, container_size=LIBRARY_PAGE_SIZE, maxresults=LIBRARY_PAGE_SIZE, params=params)
+                for item in page:
+                    media = Media._make(getattr(item, field, None) for field in MEDIA_FIELDS)
+                    media_by_type[item.type].append((media, media_label(media)))
+                num_loaded += len(page)
+                if verbose:
+                    update_status(STATUS_LOADING_PROGRESS % (num_loaded, num_total))
+                if len(page) < LIBRARY_PAGE_SIZE:
+                    break
+                start += LIBRARY_PAGE_SIZE
+    media_by_type = dict(media_by_type)
+    save_cache(server, stamp, media_by_type)
     return media_by_type
 
 # view details about a single movie: https://python-plexapi.readthedocs.io/en/latest/modules/video.html#plexapi.video.Movie
-def show_movie(movie):
-    text = '<ansired>- Title:</ansired> %s' % movie.title
-    if movie.editionTitle is not None:
-        text += ' [%s]' % movie.editionTitle
+def show_movie(server, movie):
+    parts = ['<ansired>- Title:</ansired> %s%s' % (movie.title, '' if movie.editionTitle is None else ' [%s]' % movie.editionTitle)]
     if movie.originalTitle is not None:
-        text += '\n<ansired>- Original Title:</ansired> %s' % movie.originalTitle
+        parts.append('<ansired>- Original Title:</ansired> %s' % movie.originalTitle)
     if movie.duration is not None:
-        text += '\n<ansired>- Duration:</ansired> %s' % ms_to_str(movie.duration)
+        parts.append('<ansired>- Duration:</ansired> %s' % ms_to_str(movie.duration))
     if movie.originallyAvailableAt is not None:
-        text += '\n<ansired>- Release Date:</ansired> %s' % movie.originallyAvailableAt.strftime("%Y-%m-%d")
+        parts.append('<ansired>- Release Date:</ansired> %s' % movie.originallyAvailableAt.date().isoformat())
     if movie.contentRating is not None:
-        text += '\n<ansired>- Content Rating:</ansired> %s' % movie.contentRating
+        parts.append('<ansired>- Content Rating:</ansired> %s' % movie.contentRating)
     if movie.rating is not None:
-        text += '\n<ansired>- Critic Rating:</ansired> %s' % movie.rating
-    message_dialog(title=server.friendlyName, text=HTML(text)).run()
+        parts.append('<ansired>- Critic Rating:</ansired> %s' % movie.rating)
+    run_dialog(message_dialog(title=server.friendlyName, text=HTML('\n'.join(parts))))
 
 # browse all media in this server
 def server_operation_browse(server):
     media_by_type = server_list_all(server)
+
+    # build the (sorted) menus once, as media_by_type doesn't change while browsing
+    values = sorted(((t, "%s (%d items)" % (MEDIA_TEXT[t], len(l))) for t, l in media_by_type.items()), key=itemgetter(1))
+    movies = tuple(sorted(media_by_type.get('movie', list()), key=itemgetter(1)))
+
     while True:
         # pick media type (or exit)
-        values = [(t, ("%s (%d items)" % (MEDIA_TEXT[t], len(l)))) for t, l in media_by_type.items()]
-        values.sort(key=lambda x: x[1])
-        media_type = radiolist_dialog(title=server.friendlyName, text=TEXT['select_server_media_type'], values=values).run()
+        media_type = run_dialog(radiolist_dialog(title=server.friendlyName, text=SELECT_SERVER_MEDIA_TYPE, values=values))
         if media_type is None:
             break
 
         # list all movies
         elif media_type == 'movie':
-            movies = [(movie, '%s (%d)' % (movie.title, movie.year)) for movie in media_by_type[media_type]]
-            movies.sort(key=lambda x: x[1])
             while True:
-                movie = radiolist_dialog(title='Movies (%s)' % server.friendlyName, text=TEXT['select_movie'], values=movies).run()
+                movie = run_dialog(list_dialog(title='Movies (%s)' % server.friendlyName, text=SELECT_MOVIE, values=movies))
                 if movie is None:
                     break
-                show_movie(movie)
+                show_movie(server, movie)
 
         # invalid media type (shouldn't get here)
         else:
             raise ValueError("Invalid media type: %s" % media_type)
 
+# reload all media in this server, replacing the cached list
+def server_operation_refresh(server):
+    server_list_all(server, refresh=True)
+
 # main content
 if __name__ == "__main__":
     # authenticate account: https://python-plexapi.readthedocs.io/en/latest/modules/myplex.html#plexapi.myplex.MyPlexAccount
@@ -175,6 +481,10 @@ if __name__ == "__main__":
         elif server_operation == 'browse':
             server_operation_browse(server)
 
+        # refresh cached media
+        elif server_operation == 'refresh':
+            server_operation_refresh(server)
+
         # shouldn't get here
         else:
             raise ValueError("Invalid server operation: %s" % server_operation)